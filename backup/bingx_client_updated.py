@@ -2,6 +2,7 @@
 Updated BingX API Client based on the old project
 This includes balance, PnL, positions, and other functionality from the old client
 """
+import asyncio
 import hmac
 import hashlib
 import time
@@ -15,6 +16,14 @@ from bingx_endpoints import ALL_ENDPOINTS
 
 
 class BingXClient:
+    # Ticker endpoint variations, tried in order as the API might have changed
+    TICKER_PATHS = (
+        "/openApi/swap/v2/quote/ticker/price",
+        "/openApi/swap/v1/quote/ticker/price",
+        "/openApi/market/ticker/price",
+        "/openApi/ticker/price",
+    )
+
     def __init__(self, mode: str = "swap"):
         """
         Initialize BingX API client
@@ -41,6 +50,13 @@ class BingXClient:
         self.base_url = config.get_base_url()
         self.session = aiohttp.ClientSession()
         
+        # Short-lived positions cache shared by PnL/account helpers
+        self.positions_cache_ttl = 1.0  # seconds
+        self._positions_cache = None  # (monotonic timestamp, response)
+        
+        # Ticker path that last answered, tried first on the next call
+        self._ticker_path = None
+        
         # Setup logging
         logging.basicConfig(
             level=getattr(logging, config.LOG_LEVEL),
@@ -174,6 +190,8 @@ class BingXClient:
         try:
             async with self.session.post(f"{self.base_url}{endpoint}", headers=headers, params=params) as resp:
                 result = await resp.json()
+                # Positions change once an order goes through
+                self._positions_cache = None
                 self.logger.info(f"Order placed: {result}")
                 return result
         except Exception as e:
@@ -190,35 +208,23 @@ class BingXClient:
         Returns:
             Ticker price data
         """
-        # Try multiple endpoint variations as the API might have changed
-        endpoints_to_try = [
-            f"/openApi/swap/v2/quote/ticker/price?symbol={symbol}",
-            f"/openApi/swap/v1/quote/ticker/price?symbol={symbol}",
-            f"/openApi/market/ticker/price?symbol={symbol}",
-            f"/openApi/ticker/price?symbol={symbol}"
-        ]
+        query_params = {"symbol": symbol}
         
-        params = {"symbol": symbol} if symbol else {}
+        # Start with the path that worked last time so the fallbacks are only probed once
+        paths = self.TICKER_PATHS
+        if self._ticker_path is not None:
+            paths = (self._ticker_path,) + tuple(p for p in paths if p != self._ticker_path)
         
-        for endpoint in endpoints_to_try:
+        for path in paths:
             try:
-                # Extract the actual endpoint path without query parameters for proper formatting
-                if '?' in endpoint:
-                    path, query_part = endpoint.split('?', 1)
-                    query_params = dict(param.split('=') for param in query_part.split('&'))
-                    # Merge with symbol param
-                    query_params.update(params)
-                else:
-                    path = endpoint
-                    query_params = params if params else {}
-                
                 async with self.session.get(f"{self.base_url}{path}", params=query_params) as resp:
                     result = await resp.json()
                     if result.get("code") == 0 or (result.get("code") != 100400 and "not exist" not in result.get("msg", "")):
+                        self._ticker_path = path
                         self.logger.info(f"Ticker retrieved for {symbol}: {result}")
                         return result
             except Exception as e:
-                self.logger.error(f"Error trying ticker endpoint {endpoint}: {e}")
+                self.logger.error(f"Error trying ticker endpoint {path}: {e}")
                 continue
         
         # If all endpoints fail, return an error response
@@ -229,14 +235,22 @@ class BingXClient:
             "data": {}
         }
 
-    async def get_positions(self) -> Optional[Dict[str, Any]]:
+    async def get_positions(self, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Get current positions (only available in swap mode)
         
+        Args:
+            use_cache: Serve a successful response younger than positions_cache_ttl
+            
         Returns:
             Position data or None if in spot mode
         """
         if self.mode == "swap":
+            if use_cache and self._positions_cache is not None:
+                cached_at, cached = self._positions_cache
+                if time.monotonic() - cached_at < self.positions_cache_ttl:
+                    return cached
+            
             endpoint = ALL_ENDPOINTS['get_positions']
             
             params = {"timestamp": int(time.time() * 1000)}
@@ -249,6 +263,7 @@ class BingXClient:
                     result = await resp.json()
                     if result.get("code") == 0:
                         self.logger.info(f"Positions retrieved: {result}")
+                        self._positions_cache = (time.monotonic(), result)
                         return result
                     else:
                         self.logger.error(f"Error retrieving positions: {result}")
@@ -319,7 +334,7 @@ class BingXClient:
         """
         if self.mode == "swap":
             # First get the current position to determine side and size to close
-            positions_data = await self.get_positions()
+            positions_data = await self.get_positions(use_cache=False)
             if positions_data and positions_data.get("data"):
                 # Find the position for the given symbol
                 target_position = None
@@ -369,8 +384,12 @@ class BingXClient:
             Complete account information including balance and positions
         """
         try:
-            balance = await self.get_balance()
-            positions = await self.get_positions() if self.mode == "swap" else None
+            # Balance and positions are independent requests, so overlap them
+            if self.mode == "swap":
+                balance, positions = await asyncio.gather(self.get_balance(), self.get_positions())
+            else:
+                balance = await self.get_balance()
+                positions = None
             
             account_info = {
                 "balance": balance,
@@ -557,5 +576,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
@@ -19,18 +19,18 @@ def validate_api_keys():
     return True
 
 async def test_api_connection(client):
-    """Проверяет работоспособность API ключей"""
+    """Проверяет работоспособность API ключей и возвращает полученный баланс (или None)"""
     try:
         print("🔍 Проверка API ключей...")
         balance = await client.get_balance()
         if 'code' in balance and balance['code'] != 0:
             print(f"❌ Ошибка API: {balance.get('msg', 'Неизвестная ошибка')}")
-            return False
+            return None
         print("✅ API ключи валидны, подключение успешно!")
-        return True
+        return balance
     except Exception as e:
         print(f"❌ Ошибка при проверке API: {e}")
-        return False
+        return None
 
 async def main():
     print("🚀 Starting BingX Trading Bot...")
@@ -50,7 +50,8 @@ async def main():
         print(f"🔗 Connected to: {client.base_url}")
         
         # Test the API connection
-        if not await test_api_connection(client):
+        balance = await test_api_connection(client)
+        if balance is None:
             print("❌ Завершение работы из-за проблем с API ключами")
             await client.close()
             sys.exit(1)
@@ -64,9 +65,8 @@ async def main():
         print("   5. Get PnL")
         print("   6. Close positions (swap mode only)")
         
-        # Example: Get balance
-        print("\n💰 Retrieving account balance...")
-        balance = await client.get_balance()
+        # Example: Get balance (already fetched by the connection check)
+        print("\n💰 Account balance (from the connection check):")
         print(f"Balance response: {balance}")
         
         # Close the client session
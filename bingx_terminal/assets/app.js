@@ -7,6 +7,60 @@ let currentSymbol = 'BTC-USDT';
 let currentTimeframe = '1m';
 let isDemoMode = false;
 let updateInterval = null;
+let updatesActive = false;
+let tickCount = 0;
+
+// One master tick drives every periodic task; each task runs on its own
+// period (in ticks) and phase so the work is spread across ticks
+const TICK_MS = 1000;
+const MARKET_TASKS = [
+    // [task, period, phase]
+    [refreshChartIfDirty, 1, 0],
+    [updateOrderBook, 5, 0],
+    [updateAIAnalysis, 5, 2],
+    [updateBalance, 5, 4]
+];
+
+// Chart theme and config are defined once and shared by every redraw
+const CHART_THEME = Object.freeze({
+    height: 400,
+    paper_bgcolor: 'rgba(0,0,0,0)',
+    plot_bgcolor: 'rgba(0,0,0,0)',
+    font: Object.freeze({ color: '#ffffff' })
+});
+const CHART_CONFIG = Object.freeze({ responsive: true });
+
+// Candle duration per timeframe, used to detect when a new bar opens
+const TIMEFRAME_MS = Object.freeze({
+    '1m': 60000,
+    '5m': 300000,
+    '15m': 900000,
+    '1h': 3600000,
+    '4h': 14400000,
+    '1d': 86400000
+});
+let chartDirty = true;
+let lastCandleIndex = null;
+
+// Candles kept on the chart; older ones scroll off as new bars are appended
+const CHART_POINTS = 101;
+
+// Order book rows are created once; refreshes only rewrite their text
+const ORDERBOOK_DEPTH = 10;
+let orderBookCells = null;
+
+// Coalesce bursts of symbol changes (e.g. keyboard scrolling the select)
+const SYMBOL_DEBOUNCE_MS = 150;
+let symbolDebounceTimer = null;
+
+// Event listeners are bound once, however often initialization runs
+let listenersBound = false;
+
+// Balance text last written to the page
+let lastBalanceText = null;
+
+// AI signal last rendered in the badge
+let lastSignal = null;
 
 // DOM Elements
 const elements = {
@@ -51,76 +105,97 @@ document.addEventListener('DOMContentLoaded', function() {
 
 // Initialize event listeners
 function initializeEventListeners() {
-    // Button events
-    elements.connectBtn.addEventListener('click', showSettingsModal);
-    elements.demoBtn.addEventListener('click', connectDemo);
-    elements.saveSettingsBtn.addEventListener('click', saveSettings);
-    elements.closeModal.addEventListener('click', hideSettingsModal);
-    elements.refreshAiBtn.addEventListener('click', updateAIAnalysis);
-    elements.refreshPositionsBtn.addEventListener('click', updatePositions);
-    elements.refreshHistoryBtn.addEventListener('click', updateHistory);
-    
-    // Trading button
-    elements.executeTradeBtn.addEventListener('click', executeTrade);
-    
-    // Dropdown events
-    elements.symbolSelect.addEventListener('change', function() {
-        currentSymbol = this.value;
-        updateMarketData();
-    });
+    // Wiring is idempotent so a re-initialization never runs handlers twice
+    if (listenersBound) {
+        return;
+    }
+    listenersBound = true;
     
-    elements.timeframeSelect.addEventListener('change', function() {
-        currentTimeframe = this.value;
-        updateChartData();
-    });
+    const bindings = [
+        // Button events
+        [elements.connectBtn, 'click', showSettingsModal],
+        [elements.demoBtn, 'click', connectDemo],
+        [elements.saveSettingsBtn, 'click', saveSettings],
+        [elements.closeModal, 'click', hideSettingsModal],
+        [elements.refreshAiBtn, 'click', updateAIAnalysis],
+        [elements.refreshPositionsBtn, 'click', updatePositions],
+        [elements.refreshHistoryBtn, 'click', updateHistory],
+        // Trading button
+        [elements.executeTradeBtn, 'click', executeTrade],
+        // Dropdown events
+        [elements.symbolSelect, 'change', onSymbolChanged],
+        [elements.timeframeSelect, 'change', onTimeframeChanged],
+        // Close modal when clicking outside
+        [window, 'click', onWindowClick],
+        // Pause polling while the window is hidden or minimized
+        [document, 'visibilitychange', onVisibilityChanged]
+    ];
     
-    // Close modal when clicking outside
-    window.addEventListener('click', function(event) {
-        if (event.target === elements.settingsModal) {
-            hideSettingsModal();
-        }
-    });
+    for (const [target, type, handler] of bindings) {
+        target.addEventListener(type, handler);
+    }
+}
+
+function onSymbolChanged() {
+    const symbol = this.value;
+    clearTimeout(symbolDebounceTimer);
+    symbolDebounceTimer = setTimeout(() => applySymbolChange(symbol), SYMBOL_DEBOUNCE_MS);
+}
+
+function applySymbolChange(symbol) {
+    symbolDebounceTimer = null;
+    currentSymbol = symbol;
+    chartDirty = true;
+    updateMarketData();
+}
+
+function onTimeframeChanged() {
+    currentTimeframe = this.value;
+    updateChartData();
+}
+
+function onWindowClick(event) {
+    if (event.target === elements.settingsModal) {
+        hideSettingsModal();
+    }
+}
+
+// Build a chart layout on top of the shared theme
+function buildChartLayout(title) {
+    // Axes get fresh objects because Plotly writes computed ranges into them
+    return {
+        ...CHART_THEME,
+        title: title,
+        // x values are numeric candle open times (epoch ms), so the axis is declared as dates
+        xaxis: { title: 'Time', type: 'date' },
+        yaxis: { title: 'Price' }
+    };
 }
 
 // Initialize chart
 function initializeChart() {
-    const layout = {
-        title: `${currentSymbol} Price Chart`,
-        xaxis: { title: 'Time' },
-        yaxis: { title: 'Price' },
-        height: 400,
-        paper_bgcolor: 'rgba(0,0,0,0)',
-        plot_bgcolor: 'rgba(0,0,0,0)',
-        font: { color: '#ffffff' }
-    };
-    
-    const config = { responsive: true };
+    const layout = buildChartLayout(`${currentSymbol} Price Chart`);
     
-    chart = Plotly.newPlot('chart-container', [], layout, config);
+    chart = Plotly.newPlot('chart-container', [], layout, CHART_CONFIG);
 }
 
 // Update chart with new data
 function updateChartData() {
     // In a real implementation, this would fetch data from the backend
     // For now, we'll create mock data
-    const time = [];
-    const open = [];
-    const high = [];
-    const low = [];
-    const close = [];
-    
-    const now = new Date();
-    for (let i = 100; i >= 0; i--) {
-        const timePoint = new Date(now.getTime() - i * 60000); // 1-minute intervals
-        time.push(timePoint);
-        
-        const basePrice = 40000 + Math.random() * 1000 - 500; // Base price around $40,000
-        const variation = Math.random() * 100;
-        
-        open.push(basePrice);
-        high.push(basePrice + variation);
-        low.push(basePrice - variation);
-        close.push(basePrice + (Math.random() - 0.5) * 200);
+    const points = CHART_POINTS;
+    const time = new Array(points);
+    const open = new Array(points);
+    const high = new Array(points);
+    const low = new Array(points);
+    const close = new Array(points);
+    
+    // Bars sit on candle open times for the selected timeframe, ending at the forming candle
+    const candleMs = TIMEFRAME_MS[currentTimeframe];
+    const candleIndex = currentCandleIndex();
+    for (let i = 0; i < points; i++) {
+        time[i] = (candleIndex - (points - 1 - i)) * candleMs;
+        [open[i], high[i], low[i], close[i]] = mockCandle();
     }
     
     const trace = {
@@ -133,51 +208,114 @@ function updateChartData() {
         name: currentSymbol
     };
     
-    const layout = {
-        title: `${currentSymbol} Price Chart (${currentTimeframe})`,
-        xaxis: { title: 'Time' },
-        yaxis: { title: 'Price' },
-        height: 400,
-        paper_bgcolor: 'rgba(0,0,0,0)',
-        plot_bgcolor: 'rgba(0,0,0,0)',
-        font: { color: '#ffffff' }
-    };
+    const layout = buildChartLayout(`${currentSymbol} Price Chart (${currentTimeframe})`);
+    
+    // react diffs against the existing plot instead of tearing it down and rebuilding it
+    Plotly.react('chart-container', [trace], layout, CHART_CONFIG);
     
-    Plotly.newPlot('chart-container', [trace], layout);
+    chartDirty = false;
+    lastCandleIndex = candleIndex;
+}
+
+// Generate one mock [open, high, low, close] bar
+function mockCandle() {
+    const basePrice = 40000 + Math.random() * 1000 - 500; // Base price around $40,000
+    const variation = Math.random() * 100;
+    
+    return [
+        basePrice,
+        basePrice + variation,
+        basePrice - variation,
+        basePrice + (Math.random() - 0.5) * 200
+    ];
+}
+
+// Append the newly opened candle without rebuilding the whole chart
+function appendCandle(candleIndex) {
+    const [open, high, low, close] = mockCandle();
+    
+    // extendTraces adds one bar and drops the oldest past CHART_POINTS
+    Plotly.extendTraces('chart-container', {
+        x: [[candleIndex * TIMEFRAME_MS[currentTimeframe]]],
+        open: [[open]],
+        high: [[high]],
+        low: [[low]],
+        close: [[close]]
+    }, [0], CHART_POINTS);
+    
+    lastCandleIndex = candleIndex;
+}
+
+// Index of the candle currently forming for the selected timeframe
+function currentCandleIndex() {
+    return Math.floor(Date.now() / TIMEFRAME_MS[currentTimeframe]);
+}
+
+// Redraw the chart when the selection changed; a single newly opened candle is appended
+function refreshChartIfDirty() {
+    const candleIndex = currentCandleIndex();
+    if (!chartDirty && candleIndex !== lastCandleIndex) {
+        if (candleIndex === lastCandleIndex + 1) {
+            appendCandle(candleIndex);
+            return;
+        }
+        // Several candles opened (e.g. while updates were paused); appending one would leave a gap
+        chartDirty = true;
+    }
+    if (chartDirty) {
+        updateChartData();
+    }
 }
 
 // Update market data (order book, etc.)
 function updateMarketData() {
     updateOrderBook();
-    updateChartData();
+    refreshChartIfDirty();
     updateAIAnalysis();
 }
 
+// Create the fixed set of [price, amount] cells for one side of the book
+function buildOrderBookRows(list) {
+    const cells = [];
+    const fragment = document.createDocumentFragment();
+    
+    for (let i = 0; i < ORDERBOOK_DEPTH; i++) {
+        const row = document.createElement('li');
+        const price = document.createElement('span');
+        const amount = document.createElement('span');
+        row.append(price, ' ', amount);
+        fragment.appendChild(row);
+        cells.push([price, amount]);
+    }
+    
+    list.replaceChildren(fragment);
+    return cells;
+}
+
 // Update order book
 function updateOrderBook() {
-    // Clear existing lists
-    elements.bidsList.innerHTML = '';
-    elements.asksList.innerHTML = '';
+    if (orderBookCells === null) {
+        orderBookCells = {
+            bids: buildOrderBookRows(elements.bidsList),
+            asks: buildOrderBookRows(elements.asksList)
+        };
+    }
     
     // Generate mock order book data
     let bidPrice = 40000;
     let askPrice = 40001;
     
     // Add bids (buy orders)
-    for (let i = 0; i < 10; i++) {
-        const li = document.createElement('li');
-        const amount = (Math.random() * 10).toFixed(4);
-        li.innerHTML = `<span>${bidPrice.toFixed(2)}</span> <span>${amount}</span>`;
-        elements.bidsList.appendChild(li);
+    for (const [price, amount] of orderBookCells.bids) {
+        price.textContent = bidPrice.toFixed(2);
+        amount.textContent = (Math.random() * 10).toFixed(4);
         bidPrice -= (Math.random() * 10);
     }
     
     // Add asks (sell orders)
-    for (let i = 0; i < 10; i++) {
-        const li = document.createElement('li');
-        const amount = (Math.random() * 10).toFixed(4);
-        li.innerHTML = `<span>${askPrice.toFixed(2)}</span> <span>${amount}</span>`;
-        elements.asksList.appendChild(li);
+    for (const [price, amount] of orderBookCells.asks) {
+        price.textContent = askPrice.toFixed(2);
+        amount.textContent = (Math.random() * 10).toFixed(4);
         askPrice += (Math.random() * 10);
     }
     
@@ -197,8 +335,7 @@ function updateAIAnalysis() {
     const randomSignal = signals[Math.floor(Math.random() * signals.length)];
     const confidence = Math.floor(Math.random() * 100);
     
-    elements.aiSignal.textContent = randomSignal;
-    elements.aiSignal.className = `signal-value signal-${randomSignal.toLowerCase()}`;
+    renderSignal(randomSignal);
     elements.confidenceText.textContent = `(${confidence}%)`;
     
     // Update indicators with random values
@@ -208,10 +345,20 @@ function updateAIAnalysis() {
     elements.trendValue.textContent = ['Up', 'Down', 'Neutral'][Math.floor(Math.random() * 3)];
 }
 
+// Restyle the signal badge only when the signal itself changes
+function renderSignal(signal) {
+    if (signal === lastSignal) {
+        return;
+    }
+    elements.aiSignal.textContent = signal;
+    elements.aiSignal.className = `signal-value signal-${signal.toLowerCase()}`;
+    lastSignal = signal;
+}
+
 // Update positions
 function updatePositions() {
-    // Clear existing positions
-    elements.positionsList.innerHTML = '';
+    // Build rows off-document so the list is swapped in a single reflow
+    const fragment = document.createDocumentFragment();
     
     // Add mock positions
     for (let i = 0; i < 3; i++) {
@@ -233,14 +380,17 @@ function updatePositions() {
             <div class="${pnl >= 0 ? 'positive' : 'negative'}">PnL: $${pnl}</div>
         `;
         
-        elements.positionsList.appendChild(positionItem);
+        fragment.appendChild(positionItem);
     }
+    
+    // Replace existing positions
+    elements.positionsList.replaceChildren(fragment);
 }
 
 // Update trade history
 function updateHistory() {
-    // Clear existing history
-    elements.historyBody.innerHTML = '';
+    // Build rows off-document so the table is swapped in a single reflow
+    const fragment = document.createDocumentFragment();
     
     // Add mock history
     for (let i = 0; i < 5; i++) {
@@ -262,8 +412,11 @@ function updateHistory() {
             <td class="${pnl >= 0 ? 'positive' : 'negative'}">$${pnl}</td>
         `;
         
-        elements.historyBody.appendChild(row);
+        fragment.appendChild(row);
     }
+    
+    // Replace existing history
+    elements.historyBody.replaceChildren(fragment);
 }
 
 // Connect in demo mode
@@ -317,7 +470,16 @@ function updateBalance() {
     // In a real implementation, this would fetch from the backend
     // For now, we'll show a mock balance
     const balance = (30000 + Math.random() * 20000).toFixed(2);
-    elements.balanceDisplay.textContent = `Balance: $${balance}`;
+    renderBalance(balance);
+}
+
+// Write the balance only when it differs from what is already shown
+function renderBalance(balance) {
+    const text = `Balance: $${balance}`;
+    if (text !== lastBalanceText) {
+        elements.balanceDisplay.textContent = text;
+        lastBalanceText = text;
+    }
 }
 
 // Execute a trade
@@ -343,20 +505,50 @@ function executeTrade() {
 
 // Start market data updates
 function startMarketUpdates() {
+    updatesActive = true;
+    if (!document.hidden) {
+        resumeMarketUpdates();
+    }
+}
+
+// (Re)arm the polling interval
+function resumeMarketUpdates() {
     // Clear any existing interval
+    pauseMarketUpdates();
+    
+    updateInterval = setInterval(onMarketTick, TICK_MS);
+}
+
+// Run the tasks whose phase falls on this tick
+function onMarketTick() {
+    tickCount++;
+    for (const [task, period, phase] of MARKET_TASKS) {
+        if (tickCount % period === phase) {
+            task();
+        }
+    }
+}
+
+// Stop polling without forgetting that updates were requested
+function pauseMarketUpdates() {
     if (updateInterval) {
         clearInterval(updateInterval);
+        updateInterval = null;
+    }
+}
+
+// Skip polling and redraws while nothing is being rendered
+function onVisibilityChanged() {
+    if (!updatesActive) {
+        return;
     }
     
-    // Update every 5 seconds
-    updateInterval = setInterval(() => {
+    if (document.hidden) {
+        pauseMarketUpdates();
+    } else {
+        // Catch up immediately instead of waiting a full interval
         updateMarketData();
         updateBalance();
-    }, 5000);
+        resumeMarketUpdates();
+    }
 }
-
-// Initialize the first update
-setTimeout(() => {
-    updateMarketData();
-    updateBalance();
-}, 1000);
\ No newline at end of file
@@ -6,19 +6,32 @@ import os
 import sys
 import json
 import time
+import hmac
+import hashlib
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
-import websocket
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from urllib.parse import urlencode
 import webview
 from cryptography.fernet import Fernet
-import joblib
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import StandardScaler
 import pickle
 
+# Model artifacts, resolved once at import
+MODELS_DIR = "models"
+MODEL_FILE = os.path.join(MODELS_DIR, "trading_model.pkl")
+SCALER_FILE = os.path.join(MODELS_DIR, "scaler.pkl")
+
+# Worker count for model predictions; None keeps them on the calling thread, since
+# joblib dispatch costs more than it saves on the small batches predict_signals scores
+PREDICT_N_JOBS = None
+
+# Upper bound on REST requests in flight at once (two per symbol in a batch scan)
+MAX_CONCURRENT_REQUESTS = 16
+
 class BingXTerminal:
     def __init__(self):
         self.api_key = ""
@@ -29,46 +42,81 @@ class BingXTerminal:
         self.ws_public = None
         self.ws_private = None
         self.encrypted_keys_file = "encrypted_keys.dat"
-        self.model_file = "models/trading_model.pkl"
-        self.scaler_file = "models/scaler.pkl"
+        self.model_file = MODEL_FILE
+        self.scaler_file = SCALER_FILE
         
-        # Initialize AI model
-        self.model = None
-        self.scaler = None
-        self.load_or_create_model()
+        # AI model and scaler, loaded on first use so startup doesn't wait on
+        # unpickling; kept as one (model, scaler) tuple so a retrain swaps both at once
+        self._model_state = None
         
         # Trading data storage
         self.market_data = {}
         self.positions = {}
         self.orders = {}
         
+        # Worker pool for overlapping independent REST requests
+        self.executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+        
+        # Persistent HTTP session so requests reuse keep-alive connections;
+        # the pool is sized so concurrent workers don't open throwaway connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+    @property
+    def model_state(self):
+        """Trading model and feature scaler as one (model, scaler) pair, loaded lazily"""
+        if self._model_state is None:
+            self.load_or_create_model()
+        return self._model_state
+    
+    @property
+    def model(self):
+        """Trading model"""
+        return self.model_state[0]
+    
+    @property
+    def scaler(self):
+        """Feature scaler"""
+        return self.model_state[1]
+    
     def load_or_create_model(self):
         """Load existing model or create a new one"""
+        # scikit-learn is imported here so the UI can start before it is needed
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.preprocessing import StandardScaler
+        
+        # A missing file lands in the except branch, so no separate exists() check
         try:
-            if os.path.exists(self.model_file):
-                with open(self.model_file, 'rb') as f:
-                    self.model = pickle.load(f)
-            else:
-                self.model = RandomForestClassifier(n_estimators=100, random_state=42)
+            with open(self.model_file, 'rb') as f:
+                model = pickle.load(f)
         except:
-            self.model = RandomForestClassifier(n_estimators=100, random_state=42)
+            model = RandomForestClassifier(n_estimators=100, random_state=42)
             
         try:
-            if os.path.exists(self.scaler_file):
-                with open(self.scaler_file, 'rb') as f:
-                    self.scaler = pickle.load(f)
-            else:
-                self.scaler = StandardScaler()
+            with open(self.scaler_file, 'rb') as f:
+                scaler = pickle.load(f)
         except:
-            self.scaler = StandardScaler()
+            scaler = StandardScaler()
+        
+        self._set_model_state(model, scaler)
+    
+    def _set_model_state(self, model, scaler):
+        """Install a (model, scaler) pair, with the model set up for prediction"""
+        # Forests pickled by train_model.py carry n_jobs=-1 from their fit
+        if 'n_jobs' in model.get_params():
+            model.set_params(n_jobs=PREDICT_N_JOBS)
+        self._model_state = (model, scaler)
     
     def save_model(self):
         """Save the trained model"""
-        os.makedirs("models", exist_ok=True)
+        model, scaler = self.model_state
+        os.makedirs(MODELS_DIR, exist_ok=True)
         with open(self.model_file, 'wb') as f:
-            pickle.dump(self.model, f)
+            pickle.dump(model, f)
         with open(self.scaler_file, 'wb') as f:
-            pickle.dump(self.scaler, f)
+            pickle.dump(scaler, f)
     
     def encrypt_keys(self, api_key, secret_key):
         """Encrypt API keys using Fernet encryption"""
@@ -107,30 +155,22 @@ class BingXTerminal:
         self.demo_mode = demo
         self.encrypt_keys(api_key, secret_key)
     
+    def _sign(self, payload):
+        """HMAC-SHA256 sign a payload string with the secret key"""
+        return hmac.new(
+            self.secret_key.encode('utf-8'),
+            payload.encode('utf-8'),
+            hashlib.sha256
+        ).hexdigest()
+    
     def get_signature(self, timestamp, recvWindow=5000):
         """Generate signature for API requests"""
-        import hmac
-        import hashlib
-        
-        if self.demo_mode:
-            # Demo mode might have different requirements
-            pass
-            
         # Create signature string
         signature_string = f"{self.api_key}{timestamp}{recvWindow}"
-        signature = hmac.new(
-            self.secret_key.encode('utf-8'),
-            signature_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        return self._sign(signature_string)
     
     def make_request(self, method, endpoint, params=None, signed=False):
         """Make API request to BingX"""
-        import hmac
-        import hashlib
-        from urllib.parse import urlencode
-        
         headers = {
             'X-BX-APIKEY': self.api_key
         }
@@ -146,23 +186,11 @@ class BingXTerminal:
             params['recvWindow'] = recvWindow
             
             query_string = urlencode(sorted(params.items()))
-            signature_string = query_string
-            signature = hmac.new(
-                self.secret_key.encode('utf-8'),
-                signature_string.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
-            
-            params['signature'] = signature
+            params['signature'] = self._sign(query_string)
         
         url = self.base_url + endpoint
         
-        if method == 'GET':
-            response = requests.get(url, headers=headers, params=params)
-        elif method == 'POST':
-            response = requests.post(url, headers=headers, params=params)
-        elif method == 'DELETE':
-            response = requests.delete(url, headers=headers, params=params)
+        response = self.session.request(method, url, headers=headers, params=params)
         
         return response.json()
 
@@ -261,9 +289,9 @@ class BingXTerminal:
             'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
         ])
         
-        # Convert to numeric
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df[col] = pd.to_numeric(df[col])
+        # Convert to numeric in a single block conversion
+        ohlcv = ['open', 'high', 'low', 'close', 'volume']
+        df[ohlcv] = df[ohlcv].astype(np.float64)
         
         # Calculate technical indicators
         df['price_change'] = df['close'].pct_change()
@@ -277,21 +305,24 @@ class BingXTerminal:
         bids = depth_data.get('bids', [])[:10]  # Top 10 bids
         asks = depth_data.get('asks', [])[:10]  # Top 10 asks
         
-        bid_volumes = [float(bid[1]) for bid in bids]
-        ask_volumes = [float(ask[1]) for ask in asks]
+        # Let NumPy parse and sum the quantity strings in one pass per side
+        total_bid_volume = np.array([bid[1] for bid in bids], dtype=np.float64).sum()
+        total_ask_volume = np.array([ask[1] for ask in asks], dtype=np.float64).sum()
         
-        total_bid_volume = sum(bid_volumes)
-        total_ask_volume = sum(ask_volumes)
+        # Read the latest value of every indicator in a single row lookup
+        current_price, price_change, volatility, sma_10, sma_20, rsi, macd = df[[
+            'close', 'price_change', 'volatility', 'sma_10', 'sma_20', 'rsi', 'macd'
+        ]].iloc[-1].to_numpy(dtype=np.float64)
         
         # Combine all features
         features = {
-            'current_price': float(df['close'].iloc[-1]),
-            'price_change': df['price_change'].iloc[-1] if not pd.isna(df['price_change'].iloc[-1]) else 0,
-            'volatility': df['volatility'].iloc[-1] if not pd.isna(df['volatility'].iloc[-1]) else 0,
-            'sma_10_ratio': df['close'].iloc[-1] / df['sma_10'].iloc[-1] if not pd.isna(df['sma_10'].iloc[-1]) else 1,
-            'sma_20_ratio': df['close'].iloc[-1] / df['sma_20'].iloc[-1] if not pd.isna(df['sma_20'].iloc[-1]) else 1,
-            'rsi': df['rsi'].iloc[-1] if not pd.isna(df['rsi'].iloc[-1]) else 50,
-            'macd': df['macd'].iloc[-1] if not pd.isna(df['macd'].iloc[-1]) else 0,
+            'current_price': float(current_price),
+            'price_change': price_change if not np.isnan(price_change) else 0,
+            'volatility': volatility if not np.isnan(volatility) else 0,
+            'sma_10_ratio': current_price / sma_10 if not np.isnan(sma_10) else 1,
+            'sma_20_ratio': current_price / sma_20 if not np.isnan(sma_20) else 1,
+            'rsi': rsi if not np.isnan(rsi) else 50,
+            'macd': macd if not np.isnan(macd) else 0,
             'bid_ask_ratio': total_bid_volume / (total_ask_volume + 1e-8),  # Avoid division by zero
             'total_bid_volume': total_bid_volume,
             'total_ask_volume': total_ask_volume
@@ -318,73 +349,131 @@ class BingXTerminal:
     
     def predict_signal(self, symbol):
         """Generate AI trading signal for a symbol"""
-        try:
-            # Get market data
-            klines = self.get_klines(symbol, interval="1m", limit=100)
-            depth = self.get_depth(symbol, limit=20)
-            
-            if 'data' in klines and klines['data']:
-                features = self.prepare_features(klines['data'], depth)
+        return self.predict_signals([symbol])[0]
+    
+    def predict_signals(self, symbols):
+        """Generate AI trading signals for several symbols with one batched prediction"""
+        # Read the pair once so a concurrent retrain can't mix old and new halves
+        model, scaler = self.model_state
+        
+        # An unfitted model can't score anything, so don't fetch market data for it
+        if not hasattr(model, 'classes_'):
+            return [self._error_signal(symbol, "Model is not trained yet") for symbol in symbols]
+        
+        # Issue every symbol's kline and depth requests at once
+        pending = {
+            symbol: (
+                self.executor.submit(self.get_klines, symbol, interval="1m", limit=100),
+                self.executor.submit(self.get_depth, symbol, limit=20)
+            )
+            for symbol in symbols
+        }
+        
+        results = dict.fromkeys(symbols)
+        batch_symbols = []
+        features_array = None
+        for symbol, (klines_future, depth_future) in pending.items():
+            try:
+                klines = klines_future.result()
+                depth = depth_future.result()
                 
-                # Reshape for prediction if needed
-                features_array = np.array(features).reshape(1, -1)
+                if 'data' in klines and klines['data']:
+                    features = self.prepare_features(klines['data'], depth)
+                    if features_array is None:
+                        # One float32 matrix per scan (the forest compares in float32 anyway);
+                        # each symbol's row is written in place. It is sized to this call's
+                        # symbols, so a single allocation replaces the per-row arrays and the
+                        # stacking copy without sharing mutable state between calls
+                        features_array = np.empty((len(symbols), len(features)), dtype=np.float32)
+                    features_array[len(batch_symbols)] = features
+                    batch_symbols.append(symbol)
+            except Exception as e:
+                results[symbol] = self._error_signal(symbol, e)
+        
+        if batch_symbols:
+            try:
+                features_array = features_array[:len(batch_symbols)]
                 
                 # Scale features
-                if self.scaler:
-                    features_scaled = self.scaler.transform(features_array)
+                if scaler:
+                    features_scaled = scaler.transform(features_array)
                 else:
                     features_scaled = features_array
                 
-                # Make prediction
-                prediction = self.model.predict(features_scaled)[0]
-                probability = self.model.predict_proba(features_scaled)[0]
-                
-                # Determine signal
-                if prediction == 0:
-                    signal = "SELL"
-                    confidence = max(probability[0], 0) * 100
-                elif prediction == 1:
-                    signal = "BUY"
-                    confidence = max(probability[1], 0) * 100
-                else:
-                    signal = "HOLD"
-                    confidence = max(probability[2], 0) * 100 if len(probability) > 2 else 0
+                # One forest pass scores every symbol (predict() would re-run predict_proba)
+                probabilities = model.predict_proba(features_scaled)
                 
-                return {
-                    'symbol': symbol,
-                    'signal': signal,
-                    'confidence': round(confidence, 2),
-                    'timestamp': datetime.now().isoformat()
-                }
-        except Exception as e:
-            print(f"Error generating prediction: {e}")
-            return {
-                'symbol': symbol,
-                'signal': "HOLD",
-                'confidence': 0,
-                'error': str(e)
-            }
+                # Every signal in the batch shares one scan timestamp
+                timestamp = datetime.now().isoformat()
+                for symbol, probability in zip(batch_symbols, probabilities):
+                    results[symbol] = self._signal_from_probability(
+                        symbol, probability, model.classes_, timestamp
+                    )
+            except Exception as e:
+                for symbol in batch_symbols:
+                    results[symbol] = self._error_signal(symbol, e)
+        
+        return [results[symbol] for symbol in symbols]
+    
+    def _signal_from_probability(self, symbol, probability, classes, timestamp):
+        """Turn a row of class probabilities into a trading signal"""
+        prediction = classes[np.argmax(probability)]
+        
+        # Determine signal
+        if prediction == 0:
+            signal = "SELL"
+            confidence = max(probability[0], 0) * 100
+        elif prediction == 1:
+            signal = "BUY"
+            confidence = max(probability[1], 0) * 100
+        else:
+            signal = "HOLD"
+            confidence = max(probability[2], 0) * 100 if len(probability) > 2 else 0
+        
+        return {
+            'symbol': symbol,
+            'signal': signal,
+            'confidence': round(confidence, 2),
+            'timestamp': timestamp
+        }
+    
+    def _error_signal(self, symbol, error):
+        """Fallback HOLD signal for a failed prediction"""
+        print(f"Error generating prediction: {error}")
+        return {
+            'symbol': symbol,
+            'signal': "HOLD",
+            'confidence': 0,
+            'error': str(error)
+        }
     
     def train_model(self, historical_data):
         """Train the AI model with historical data"""
+        from sklearn.base import clone
+        
         try:
-            X = []
-            y = []
+            # Keep only complete samples, then split them into contiguous columns
+            samples = [
+                data_point for data_point in historical_data
+                if 'features' in data_point and 'target' in data_point
+            ]
             
-            for data_point in historical_data:
-                if 'features' in data_point and 'target' in data_point:
-                    X.append(data_point['features'])
-                    y.append(data_point['target'])
-            
-            if X and y:
-                X = np.array(X)
-                y = np.array(y)
+            if samples:
+                X = np.array([data_point['features'] for data_point in samples], dtype=np.float32)
+                y = np.array([data_point['target'] for data_point in samples])
+                
+                # Fit fresh copies so predictions keep using the current model until the swap
+                current_model, current_scaler = self.model_state
+                scaler = clone(current_scaler)
+                model = clone(current_model)
                 
                 # Scale features
-                X_scaled = self.scaler.fit_transform(X)
+                X_scaled = scaler.fit_transform(X)
                 
-                # Train model
-                self.model.fit(X_scaled, y)
+                # Train model on every core; the swap resets n_jobs for prediction
+                model.set_params(n_jobs=-1)
+                model.fit(X_scaled, y)
+                self._set_model_state(model, scaler)
                 
                 # Save the trained model
                 self.save_model()
@@ -14,6 +14,10 @@ from sklearn.metrics import classification_report, accuracy_score
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+# Target classes: 0 = SELL/Down, 1 = HOLD/Same, 2 = BUY/Up
+SIGNAL_NAMES = ('SELL', 'HOLD', 'BUY')
+SIGNAL_MAP = dict(enumerate(SIGNAL_NAMES))
+
 def calculate_technical_indicators(df):
     """
     Calculate technical indicators for the dataset
@@ -46,8 +50,8 @@ def calculate_technical_indicators(df):
     df['macd_signal'] = df['macd'].ewm(span=9).mean()
     df['macd_histogram'] = df['macd'] - df['macd_signal']
     
-    # Bollinger Bands
-    df['bb_middle'] = df['close'].rolling(window=20).mean()
+    # Bollinger Bands (the middle band is the 20-period SMA computed above)
+    df['bb_middle'] = df['sma_20']
     bb_std = df['close'].rolling(window=20).std()
     df['bb_upper'] = df['bb_middle'] + (bb_std * 2)
     df['bb_lower'] = df['bb_middle'] - (bb_std * 2)
@@ -71,9 +75,9 @@ def prepare_training_data(kline_data):
         'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
     ])
     
-    # Convert to numeric
-    for col in ['open', 'high', 'low', 'close', 'volume']:
-        df[col] = pd.to_numeric(df[col])
+    # Convert to numeric in a single block conversion
+    ohlcv = ['open', 'high', 'low', 'close', 'volume']
+    df[ohlcv] = df[ohlcv].astype(np.float64)
     
     # Calculate technical indicators
     df = calculate_technical_indicators(df)
@@ -95,14 +99,15 @@ def prepare_training_data(kline_data):
         'bb_position', 'volume_ratio'
     ]
     
-    # Remove rows with NaN values
-    df = df.dropna()
+    # Prepare features (X) and target (y) as float32, the precision the forest trains in
+    X = df[feature_columns].to_numpy(dtype=np.float32)
+    y = df['target'].to_numpy()
     
-    # Prepare features (X) and target (y)
-    X = df[feature_columns].values
-    y = df['target'].values
+    # Remove rows with NaN/inf features or no future return, using one combined
+    # mask instead of copying the whole frame through dropna()
+    mask = np.isfinite(X).all(axis=1) & np.isfinite(df['future_return'].to_numpy())
     
-    return X, y, df[feature_columns]
+    return X[mask], y[mask], df.loc[mask, feature_columns]
 
 def generate_mock_data(symbol="BTC-USDT", days=30, interval="1h"):
     """
@@ -111,27 +116,30 @@ def generate_mock_data(symbol="BTC-USDT", days=30, interval="1h"):
     """
     print(f"Generating mock data for {symbol} over {days} days...")
     
-    data = []
     base_price = 40000  # Starting price
-    current_time = datetime.now() - timedelta(days=days)
-    
-    for i in range(days * 24):  # Hours in the specified days
-        timestamp = int(current_time.timestamp() * 1000)  # Convert to milliseconds
-        
-        # Generate price with some random walk
-        change_percent = (np.random.random() - 0.5) * 0.02  # -1% to +1% change
-        open_price = base_price
-        high_price = base_price * (1 + abs(np.random.random() * 0.01))
-        low_price = base_price * (1 - abs(np.random.random() * 0.01))
-        close_price = open_price * (1 + change_percent)
-        
-        # Ensure high >= close >= low
-        high_price = max(high_price, open_price, close_price)
-        low_price = min(low_price, open_price, close_price)
-        
-        volume = np.random.random() * 1000  # Random volume
-        
-        data.append([
+    n = days * 24  # Hours in the specified days
+    start_time = datetime.now() - timedelta(days=days)
+    start_ms = int(start_time.timestamp() * 1000)  # Convert to milliseconds
+    timestamps = start_ms + np.arange(n, dtype=np.int64) * 3600000
+    
+    # Generate the whole price random walk in one vectorized pass
+    change_percent = (np.random.random(n) - 0.5) * 0.02  # -1% to +1% change
+    close_prices = base_price * np.cumprod(1 + change_percent)
+    open_prices = np.empty(n)
+    open_prices[:1] = base_price
+    open_prices[1:] = close_prices[:-1]
+    high_prices = open_prices * (1 + np.random.random(n) * 0.01)
+    low_prices = open_prices * (1 - np.random.random(n) * 0.01)
+    
+    # Ensure high >= close >= low
+    high_prices = np.maximum.reduce([high_prices, open_prices, close_prices])
+    low_prices = np.minimum.reduce([low_prices, open_prices, close_prices])
+    
+    volumes = np.random.random(n) * 1000  # Random volume
+    trade_counts = np.random.randint(100, 1000, size=n)
+    
+    data = [
+        [
             timestamp,
             str(open_price),
             str(high_price),
@@ -140,14 +148,16 @@ def generate_mock_data(symbol="BTC-USDT", days=30, interval="1h"):
             str(volume),
             timestamp + 3600000,  # close_time (1 hour later)
             str(volume * close_price),  # quote_asset_volume
-            str(np.random.randint(100, 1000)),  # number_of_trades
+            str(trades),  # number_of_trades
             str(volume * 0.4),  # taker_buy_base_asset_volume
             str(volume * close_price * 0.4),  # taker_buy_quote_asset_volume
             "0"
-        ])
-        
-        base_price = close_price
-        current_time += timedelta(hours=1)
+        ]
+        for timestamp, open_price, high_price, low_price, close_price, volume, trades in zip(
+            timestamps.tolist(), open_prices.tolist(), high_prices.tolist(),
+            low_prices.tolist(), close_prices.tolist(), volumes.tolist(), trade_counts.tolist()
+        )
+    ]
     
     return data
 
@@ -201,7 +211,7 @@ def train_model(symbol="BTC-USDT", save_path="models/trading_model.pkl", scaler_
     
     print(f"Model accuracy: {accuracy:.4f}")
     print("\nClassification Report:")
-    print(classification_report(y_test, y_pred, target_names=['SELL', 'HOLD', 'BUY']))
+    print(classification_report(y_test, y_pred, target_names=list(SIGNAL_NAMES)))
     
     # Save the model and scaler
     with open(save_path, 'wb') as f:
@@ -249,13 +259,12 @@ def predict_with_model(model, scaler, features):
     # Scale the features
     features_scaled = scaler.transform(features)
     
-    # Make prediction
-    prediction = model.predict(features_scaled)[0]
+    # Make prediction from a single forest pass (predict() would re-run predict_proba)
     probabilities = model.predict_proba(features_scaled)[0]
+    prediction = model.classes_[np.argmax(probabilities)]
     
     # Map prediction to signal
-    signal_map = {0: 'SELL', 1: 'HOLD', 2: 'BUY'}
-    signal = signal_map.get(prediction, 'HOLD')
+    signal = SIGNAL_MAP.get(prediction, 'HOLD')
     
     # Get confidence (probability of predicted class)
     confidence = max(probabilities) * 100